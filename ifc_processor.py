@@ -4,11 +4,15 @@ import logging
 from io import StringIO
 from decimal import Decimal
 import os
+from section_catalog import annotate_section_weights
 
 # ロギングの設定を詳細にする
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# 列指向形式のレスポンスで使用するメディアタイプ
+COLUMNAR_MIMETYPE = 'application/vnd.ifc-materials.columnar+json'
+
 class IFCProcessor:
     def __init__(self, file_path):
         self.ifc_file = None
@@ -103,6 +107,10 @@ class IFCProcessor:
                         continue
 
             logger.info(f"Successfully processed {len(materials)} materials")
+
+            # 断面カタログとの照合による単位重量・部材重量の付与
+            annotate_section_weights(materials)
+
             return materials
 
         except Exception as e:
@@ -262,6 +270,52 @@ class IFCProcessor:
             logger.warning(f"Error getting element properties: {str(e)}")
         return properties
 
+    def generate_columnar(self, materials):
+        """列指向形式でデータを出力（列名は一度だけ、文字列は辞書エンコード）"""
+        try:
+            column_names = []
+            for material in materials:
+                for key in material:
+                    if key not in column_names:
+                        column_names.append(key)
+
+            columns = []
+            for key in column_names:
+                values = [material.get(key) for material in materials]
+                if all(isinstance(v, str) for v in values if v is not None):
+                    # 文字列列は重複を除いた辞書とインデックス列で表現（欠損は -1）
+                    dictionary = []
+                    positions = {}
+                    codes = []
+                    for value in values:
+                        if value is None:
+                            codes.append(-1)
+                            continue
+                        if value not in positions:
+                            positions[value] = len(dictionary)
+                            dictionary.append(value)
+                        codes.append(positions[value])
+                    columns.append({
+                        'name': key,
+                        'encoding': 'dictionary',
+                        'dictionary': dictionary,
+                        'codes': codes
+                    })
+                else:
+                    columns.append({
+                        'name': key,
+                        'encoding': 'plain',
+                        'values': values
+                    })
+
+            return {
+                'count': len(materials),
+                'columns': columns
+            }
+        except Exception as e:
+            logger.error(f"Error generating columnar data: {str(e)}", exc_info=True)
+            raise ValueError(f"列指向データの生成中にエラーが発生しました: {str(e)}")
+
     def generate_csv(self, materials):
         """CSV形式でデータを出力"""
         try:
@@ -270,7 +324,8 @@ class IFCProcessor:
                 'name', 'element_type', 'material_name',
                 'profile_type', 'overall_depth', 'flange_width',
                 'web_thickness', 'flange_thickness', 'width', 'height',
-                'grade', 'nominal_diameter', 'length'
+                'grade', 'nominal_diameter', 'length',
+                'section_designation', 'unit_weight', 'weight'
             ]
 
             writer = csv.DictWriter(output, fieldnames=fieldnames)
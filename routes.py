@@ -7,7 +7,7 @@ from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
 from app import db, UPLOAD_FOLDER
 from models import IFCFile, ProcessResult
-from ifc_processor import IFCProcessor
+from ifc_processor import IFCProcessor, COLUMNAR_MIMETYPE
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -165,11 +165,24 @@ def process_materials():
 
             logger.info("Processing results saved to database")
 
-            return jsonify({
-                'success': True,
-                'materials': materials,
-                'message': '材料集計が完了しました。'
-            })
+            # Acceptヘッダーで列指向形式が優先されている場合はそちらで返す
+            preferred = request.accept_mimetypes.best_match(['application/json', COLUMNAR_MIMETYPE])
+            if preferred == COLUMNAR_MIMETYPE:
+                response = jsonify({
+                    'success': True,
+                    'format': 'columnar',
+                    'materials': processor.generate_columnar(materials),
+                    'message': '材料集計が完了しました。'
+                })
+                response.mimetype = COLUMNAR_MIMETYPE
+            else:
+                response = jsonify({
+                    'success': True,
+                    'materials': materials,
+                    'message': '材料集計が完了しました。'
+                })
+            response.vary.add('Accept')
+            return response
 
         except ValueError as ve:
             logger.error(f"Value error during processing: {str(ve)}")
@@ -0,0 +1,160 @@
+import csv
+import logging
+import os
+from functools import lru_cache
+
+import numpy as np
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(BASE_DIR, 'data', 'steel_sections.csv')
+
+# 寸法照合の許容差 (mm)
+DEFAULT_TOLERANCE = 1.0
+# 距離行列を一度に計算する行数（メモリ使用量の上限）
+CHUNK_ROWS = 4096
+
+
+class SectionCatalog:
+    """鋼材断面カタログ（JIS G 3192 H形鋼 / JIS G 3194 平鋼）"""
+
+    def __init__(self, csv_path=CATALOG_PATH):
+        rows = {'H': [], 'FB': []}
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                for record in csv.DictReader(f):
+                    shape = record['shape']
+                    if shape == 'H':
+                        dims = (record['h'], record['b'], record['t1'], record['t2'])
+                    elif shape == 'FB':
+                        dims = (record['h'], record['b'])
+                    else:
+                        continue
+                    rows[shape].append((record['designation'], float(record['unit_weight']),
+                                        [float(d) for d in dims]))
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Error loading section catalog: {str(e)}", exc_info=True)
+            raise ValueError(f"断面カタログを読み込めませんでした: {str(e)}")
+
+        self.h_sections = self._build_table(rows['H'])
+        self.flat_bars = self._build_table(rows['FB'])
+        logger.info(f"Loaded section catalog: {len(rows['H'])} H-shapes, {len(rows['FB'])} flat bars")
+
+    @staticmethod
+    def _build_table(rows):
+        """寸法の辞書順にソートしたNumPy配列を作成"""
+        dims = np.array([r[2] for r in rows], dtype=np.float64)
+        order = np.lexsort(dims.T[::-1])
+        return {
+            'dims': dims[order],
+            'designation': np.array([r[0] for r in rows], dtype=object)[order],
+            'unit_weight': np.array([r[1] for r in rows], dtype=np.float64)[order],
+        }
+
+    def match_i_shapes(self, overall_depth, flange_width, web_thickness, flange_thickness,
+                       tolerance=DEFAULT_TOLERANCE):
+        """I形鋼の寸法配列をH形鋼カタログに照合し、(呼称, kg/m) の配列を返す"""
+        queries = np.column_stack([
+            np.asarray(overall_depth, dtype=np.float64),
+            np.asarray(flange_width, dtype=np.float64),
+            np.asarray(web_thickness, dtype=np.float64),
+            np.asarray(flange_thickness, dtype=np.float64),
+        ])
+        return self._lookup(queries, self.h_sections, tolerance)
+
+    def match_rectangles(self, width, height, tolerance=DEFAULT_TOLERANCE):
+        """矩形断面の寸法配列を平鋼カタログに照合し、(呼称, kg/m) の配列を返す"""
+        pair = np.column_stack([
+            np.asarray(width, dtype=np.float64),
+            np.asarray(height, dtype=np.float64),
+        ])
+        # 配置の向きに依存しないよう (幅, 厚さ) = (大, 小) に揃える
+        queries = np.sort(pair, axis=1)[:, ::-1]
+        return self._lookup(queries, self.flat_bars, tolerance)
+
+    def _lookup(self, queries, table, tolerance):
+        index = self._nearest(queries, table['dims'], tolerance)
+        matched = index >= 0
+        designations = np.full(len(index), None, dtype=object)
+        unit_weights = np.full(len(index), np.nan)
+        designations[matched] = table['designation'][index[matched]]
+        unit_weights[matched] = table['unit_weight'][index[matched]]
+        return designations, unit_weights
+
+    @staticmethod
+    def _nearest(queries, dims, tolerance):
+        """各行について最大寸法差が最小のカタログ行番号を返す（許容差外は -1）"""
+        if len(queries) == 0 or len(dims) == 0:
+            return np.full(len(queries), -1, dtype=np.intp)
+
+        # 欠損値は照合対象外とし、同一寸法の部材はまとめて一度だけ照合する
+        queries = np.where(np.isfinite(queries), queries, -1.0)
+        unique, inverse = np.unique(queries, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        nearest = np.full(len(unique), -1, dtype=np.intp)
+        for start in range(0, len(unique), CHUNK_ROWS):
+            block = unique[start:start + CHUNK_ROWS]
+            distance = np.abs(block[:, None, :] - dims[None, :, :]).max(axis=2)
+            best = distance.argmin(axis=1)
+            within = distance[np.arange(len(block)), best] <= tolerance
+            nearest[start:start + len(block)] = np.where(within, best, -1)
+
+        return nearest[inverse]
+
+
+@lru_cache(maxsize=1)
+def get_section_catalog():
+    """断面カタログを一度だけ読み込んで共有"""
+    return SectionCatalog()
+
+
+def _column(materials, key):
+    return np.array([m.get(key) if m.get(key) is not None else np.nan for m in materials],
+                    dtype=np.float64)
+
+
+def annotate_section_weights(materials, tolerance=DEFAULT_TOLERANCE):
+    """材料リストに断面呼称・単位重量・部材重量を付与し、総重量 (t) を返す"""
+    if not materials:
+        return 0.0
+
+    catalog = get_section_catalog()
+    profile_types = np.array([m.get('profile_type') for m in materials], dtype=object)
+    designations = np.full(len(materials), None, dtype=object)
+    unit_weights = np.full(len(materials), np.nan)
+
+    is_i_shape = profile_types == 'I形鋼'
+    if is_i_shape.any():
+        subset = [m for m, flag in zip(materials, is_i_shape) if flag]
+        designations[is_i_shape], unit_weights[is_i_shape] = catalog.match_i_shapes(
+            _column(subset, 'overall_depth'),
+            _column(subset, 'flange_width'),
+            _column(subset, 'web_thickness'),
+            _column(subset, 'flange_thickness'),
+            tolerance=tolerance,
+        )
+
+    is_rectangle = profile_types == '矩形'
+    if is_rectangle.any():
+        subset = [m for m, flag in zip(materials, is_rectangle) if flag]
+        designations[is_rectangle], unit_weights[is_rectangle] = catalog.match_rectangles(
+            _column(subset, 'width'),
+            _column(subset, 'height'),
+            tolerance=tolerance,
+        )
+
+    # 長さ (mm) × 単位重量 (kg/m) で部材重量 (kg) を算出
+    weights = unit_weights * _column(materials, 'length') / 1000.0
+
+    for material, designation, unit_weight, weight in zip(materials, designations, unit_weights, weights):
+        material['section_designation'] = designation
+        material['unit_weight'] = float(unit_weight) if np.isfinite(unit_weight) else None
+        material['weight'] = float(weight) if np.isfinite(weight) else None
+
+    matched = int(np.isfinite(unit_weights).sum())
+    total_tonnage = float(np.nansum(weights)) / 1000.0
+    logger.info(f"Matched {matched}/{len(materials)} sections to catalog, total weight: {total_tonnage:.3f} t")
+    return total_tonnage
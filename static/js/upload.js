@@ -10,6 +10,15 @@ document.addEventListener('DOMContentLoaded', function() {
     const progressBar = uploadProgress.querySelector('.progress-bar');
     const totalItems = document.getElementById('totalItems');
     const processSpinner = processBtn.querySelector('.spinner-border');
+    const resultScroll = document.getElementById('resultScroll');
+
+    // 列指向形式のメディアタイプ（サーバー側の COLUMNAR_MIMETYPE と一致させる）
+    const COLUMNAR_MIMETYPE = 'application/vnd.ifc-materials.columnar+json';
+    // 仮想スクロールの設定（行の高さは初回描画時に実測値で更新）
+    const OVERSCAN_ROWS = 10;
+    let rowHeight = 41;
+    let tableSource = null;
+    let renderScheduled = false;
 
     // 新規ファイル選択ボタンのイベントハンドラ
     resetBtn.addEventListener('click', function() {
@@ -109,7 +118,7 @@ document.addEventListener('DOMContentLoaded', function() {
             const response = await fetch('/choice/material', {
                 method: 'POST',
                 headers: {
-                    'Accept': 'application/json',
+                    'Accept': `${COLUMNAR_MIMETYPE}, application/json;q=0.9`,
                     'Content-Type': 'application/json'
                 }
             });
@@ -119,15 +128,18 @@ document.addEventListener('DOMContentLoaded', function() {
             }
 
             const contentType = response.headers.get('content-type');
-            if (!contentType || !contentType.includes('application/json')) {
+            if (!contentType || !contentType.includes('json')) {
                 throw new Error('サーバーからの応答が不正です（JSONではありません）');
             }
 
             const data = await response.json();
             if (data.success) {
-                displayResults(data.materials);
-                downloadBtn.disabled = false;
+                const source = data.format === 'columnar'
+                    ? columnarSource(data.materials)
+                    : rowSource(data.materials);
                 resultArea.style.display = 'block';
+                displayResults(source);
+                downloadBtn.disabled = false;
                 if (data.message) {
                     alert(data.message);
                 }
@@ -175,24 +187,112 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
-    function displayResults(materials) {
-        resultTable.innerHTML = '';
-        materials.forEach(material => {
-            const row = document.createElement('tr');
-            row.innerHTML = `
-                <td>${material.name || '-'}</td>
-                <td>${material.element_type || '-'}</td>
-                <td>${material.profile_type || '-'}</td>
-                <td>${material.overall_depth ? material.overall_depth.toFixed(2) : '-'}</td>
-                <td>${material.flange_width ? material.flange_width.toFixed(2) : (material.width ? material.width.toFixed(2) : '-')}</td>
-                <td>${material.web_thickness ? material.web_thickness.toFixed(2) : '-'}</td>
-                <td>${material.flange_thickness ? material.flange_thickness.toFixed(2) : '-'}</td>
-                <td>${material.grade || '-'}</td>
-                <td>${material.nominal_diameter || '-'}</td>
-                <td>${material.length ? material.length.toFixed(2) : '-'}</td>
-            `;
-            resultTable.appendChild(row);
+    // 行オブジェクト配列と列指向データを同じ形で参照するためのアクセサ
+    function rowSource(materials) {
+        return {
+            length: materials.length,
+            get: (index, key) => materials[index][key]
+        };
+    }
+
+    function columnarSource(payload) {
+        const columns = {};
+        payload.columns.forEach(column => {
+            if (column.encoding === 'dictionary') {
+                columns[column.name] = index => {
+                    const code = column.codes[index];
+                    return code < 0 ? null : column.dictionary[code];
+                };
+            } else {
+                columns[column.name] = index => column.values[index];
+            }
         });
-        totalItems.textContent = `${materials.length} 件`;
+        return {
+            length: payload.count,
+            get: (index, key) => (columns[key] ? columns[key](index) : undefined)
+        };
+    }
+
+    function formatNumber(value) {
+        return value ? value.toFixed(2) : '-';
+    }
+
+    function buildRow(source, index) {
+        const get = key => source.get(index, key);
+        const cells = [
+            get('name') || '-',
+            get('element_type') || '-',
+            get('profile_type') || '-',
+            formatNumber(get('overall_depth')),
+            get('flange_width') ? formatNumber(get('flange_width')) : formatNumber(get('width')),
+            formatNumber(get('web_thickness')),
+            formatNumber(get('flange_thickness')),
+            get('grade') || '-',
+            get('nominal_diameter') || '-',
+            formatNumber(get('length'))
+        ];
+        const row = document.createElement('tr');
+        cells.forEach(text => {
+            const cell = document.createElement('td');
+            cell.textContent = text;
+            row.appendChild(cell);
+        });
+        return row;
+    }
+
+    function buildSpacer(height) {
+        const row = document.createElement('tr');
+        row.className = 'virtual-spacer';
+        const cell = document.createElement('td');
+        cell.colSpan = 10;
+        cell.style.height = `${height}px`;
+        row.appendChild(cell);
+        return row;
+    }
+
+    // 表示範囲の行だけを描画し、前後はスペーサー行で高さを確保する
+    function renderVisibleRows() {
+        renderScheduled = false;
+        if (!tableSource) {
+            return;
+        }
+
+        const total = tableSource.length;
+        const visibleRows = Math.ceil(resultScroll.clientHeight / rowHeight) || 1;
+        // 縞模様が崩れないよう開始行は偶数にそろえる
+        const start = Math.max(0, Math.floor(resultScroll.scrollTop / rowHeight) - OVERSCAN_ROWS) & ~1;
+        const end = Math.min(total, start + visibleRows + OVERSCAN_ROWS * 2);
+
+        const fragment = document.createDocumentFragment();
+        fragment.appendChild(buildSpacer(start * rowHeight));
+        for (let i = start; i < end; i++) {
+            fragment.appendChild(buildRow(tableSource, i));
+        }
+        fragment.appendChild(buildSpacer((total - end) * rowHeight));
+        resultTable.replaceChildren(fragment);
+
+        // 実際の行の高さを測定し、推定値と異なれば描画し直す
+        const sample = resultTable.querySelector('tr:not(.virtual-spacer)');
+        if (sample && sample.offsetHeight && sample.offsetHeight !== rowHeight) {
+            rowHeight = sample.offsetHeight;
+            scheduleRender();
+        }
+    }
+
+    function scheduleRender() {
+        if (!renderScheduled) {
+            renderScheduled = true;
+            window.requestAnimationFrame(renderVisibleRows);
+        }
+    }
+
+    resultScroll.addEventListener('scroll', scheduleRender);
+    window.addEventListener('resize', scheduleRender);
+
+    function displayResults(source) {
+        tableSource = source;
+        resultScroll.scrollTop = 0;
+        renderVisibleRows();
+        totalItems.textContent = `${source.length} 件`;
     }
 });
\ No newline at end of file